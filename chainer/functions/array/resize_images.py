@@ -1,5 +1,7 @@
 from __future__ import division
 
+import functools
+
 import numpy
 
 from chainer import backend
@@ -8,113 +10,336 @@ from chainer import function_node
 from chainer.utils import type_check
 
 
-def _infer_lines(B, C, H, W, out_H, out_W, kH, kW):
+def _infer_tile(B, C, H, W, out_H, out_W, kH, kW):
     target_size = 2 ** 17
-    line_size = B * C * (H * W // out_H + kH * kW * out_W)
-    target_lines = target_size // line_size
-
-    if target_lines < out_H:
-        lines = 1
-        while True:
-            next_lines = lines * 2
-            if next_lines > target_lines:
-                break
-            lines = next_lines
+    # number of elements touched per output pixel: the kH x kW input
+    # panel plus the output itself, for every image in the batch
+    pixel_size = B * C * (kH * kW + 1)
+    target_pixels = max(target_size // pixel_size, 1)
+
+    if target_pixels >= out_W:
+        # prefer full output lines to keep unit-stride stores
+        tile_W = out_W
+        target_lines = target_pixels // out_W
+        if target_lines < out_H:
+            tile_H = 1
+            while tile_H * 2 <= target_lines:
+                tile_H *= 2
+        else:
+            tile_H = out_H
     else:
-        lines = out_H
+        tile_H = 1
+        tile_W = 1
+        while tile_W * 2 <= target_pixels:
+            tile_W *= 2
 
-    return lines
+    return tile_H, tile_W
 
 
-def interpolate_bilinear_cpu(x, v, u, vw, uw):
-    B, C, H, W = x.shape
-    out_H, out_W = v.shape
+_interp_bilinear_cpu_kernel = None
 
-    # Interpolation is done by each output panel (i.e. multi lines)
-    # in order to better utilize CPU cache memory.
-    lines = _infer_lines(B, C, H, W, out_H, out_W, 2, 2)
 
-    vcol = numpy.empty((2, lines, out_W), dtype=v.dtype)
-    ucol = numpy.empty((2, lines, out_W), dtype=u.dtype)
-    wcol = numpy.empty((2, 2, lines, out_W), dtype=x.dtype)
+def _get_interp_bilinear_cpu_kernel():
+    # Compiles the fused gather-interpolate kernel on first use and caches
+    # it at module level. Returns a falsy value when numba is not
+    # available, in which case the caller uses the blocked numpy path.
+    global _interp_bilinear_cpu_kernel
+    if _interp_bilinear_cpu_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _interp_bilinear_cpu_kernel = False
+        else:
+            # The index and weight tables are 1D per axis; row-level
+            # values are hoisted out of the inner loop, which is then a
+            # straight-line chain of four gathers and fused multiply-adds
+            # that LLVM vectorizes to the hardware gather/FMA units
+            # (AVX2 on x86) under fastmath.
+            @numba.njit(parallel=True, fastmath=True)
+            def kernel(x, v0, v1, u0, u1, vw, uw, y):
+                BC = x.shape[0]
+                out_H = v0.shape[0]
+                out_W = u0.shape[0]
+                for bc in numba.prange(BC):
+                    for i in range(out_H):
+                        r0 = v0[i]
+                        r1 = v1[i]
+                        vw1 = vw[i]
+                        vw0 = 1 - vw1
+                        for j in range(out_W):
+                            uw1 = uw[j]
+                            uw0 = 1 - uw1
+                            y[bc, i * out_W + j] = (
+                                vw0 * (uw0 * x[bc, r0 + u0[j]]
+                                       + uw1 * x[bc, r0 + u1[j]])
+                                + vw1 * (uw0 * x[bc, r1 + u0[j]]
+                                         + uw1 * x[bc, r1 + u1[j]]))
+
+            _interp_bilinear_cpu_kernel = kernel
+    return _interp_bilinear_cpu_kernel
 
-    y = numpy.empty((B * C, out_H * out_W), dtype=x.dtype)
 
-    for i in range(0, out_H, lines):
-        l = min(lines, out_H - i)
-        vcol = vcol[:, :l]
-        ucol = ucol[:, :l]
-        wcol = wcol[:, :, :l]
+def interpolate_bilinear_cpu(x, v, u, vw, uw):
+    B, C, H, W = x.shape
+    out_H = v.shape[0]
+    out_W = u.shape[0]
+
+    kernel = _get_interp_bilinear_cpu_kernel()
+    if kernel:
+        # Fuse the panel gather, weight multiplication and 4-tap sum into
+        # a single pass so that the (B, C, 2, 2, out_H, out_W) panel
+        # buffer is never materialized. The row offset ``v * W`` is
+        # folded into the vertical indices so the inner reads are flat
+        # loads from small per-axis tables.
+        v0 = v * W
+        v1 = numpy.minimum(v + 1, H - 1) * W
+        u1 = numpy.minimum(u + 1, W - 1)
+        y = numpy.empty((B * C, out_H * out_W), dtype=x.dtype)
+        kernel(x.reshape((B * C, H * W)), v0, v1, u, u1, vw, uw, y)
+        return y.reshape((B, C, out_H, out_W))
+
+    # One replicated row and column of padding lets the neighbor indices
+    # be v + 1 and u + 1 unconditionally, removing the clamping ufunc
+    # passes from the tile loop at the cost of a single copy.
+    x = numpy.pad(x, ((0, 0), (0, 0), (0, 1), (0, 1)), mode='edge')
+
+    # Interpolation is done tile by tile over the output in order to
+    # better utilize CPU cache memory: input pixels shared by
+    # neighboring output rows and columns are reused while they are
+    # still cache resident.
+    tile_H, tile_W = _infer_tile(B, C, H, W, out_H, out_W, 2, 2)
+
+    vcol = numpy.empty((2, tile_H), dtype=v.dtype)
+    ucol = numpy.empty((2, tile_W), dtype=u.dtype)
+    tmp = numpy.empty((B * C, tile_H, tile_W), dtype=x.dtype)
+
+    # weights, synthesized once for the whole output grid instead of
+    # once per tile, and kept as four separate contiguous planes so the
+    # interpolation reads them with unit stride
+    one_vw = 1 - vw
+    one_uw = 1 - uw
+    wplanes = (one_vw[:, None] * one_uw[None, :],
+               one_vw[:, None] * uw[None, :],
+               vw[:, None] * one_uw[None, :],
+               vw[:, None] * uw[None, :])
+
+    y = numpy.empty((B * C, out_H, out_W), dtype=x.dtype)
+
+    for i in range(0, out_H, tile_H):
+        l = min(tile_H, out_H - i)
         i_end = i + l
-
-        # indices
-        vcol[0] = v[i:i_end]
-        ucol[0] = u[i:i_end]
-        numpy.add(vcol[0], 1, out=vcol[1])
-        numpy.add(ucol[0], 1, out=ucol[1])
-        numpy.minimum(vcol[1], H - 1, out=vcol[1])
-        numpy.minimum(ucol[1], W - 1, out=ucol[1])
-
-        # weights
-        #   wcol[0, 0] = (1 - uw) * (1 - vw)
-        #   wcol[0, 1] = uw * (1 - vw)
-        #   wcol[1, 0] = (1 - uw) * vw
-        #   wcol[1, 1] = uw * vw
-        wcol[0, 1] = uw[i:i_end]
-        numpy.subtract(1, wcol[0, 1], out=wcol[0, 0])
-        numpy.multiply(wcol[0], vw[i:i_end], out=wcol[1])
-        wcol[0] -= wcol[1]
-
-        # packing to the panel whose shape is (B, C, 2, 2, l, out_W)
-        panel = x[:, :, vcol[:, None], ucol[None, :]]
-
-        # interpolation
-        panel = panel.reshape((B * C, 4, l * out_W))
-        weights = wcol.reshape((4, l * out_W))
-        iout = i * out_W
-        iout_end = i_end * out_W
-        numpy.einsum('ijk,jk->ik', panel, weights, out=y[:, iout:iout_end])
-        del panel, weights
+        for j in range(0, out_W, tile_W):
+            t = min(tile_W, out_W - j)
+            j_end = j + t
+            vcol_t = vcol[:, :l]
+            ucol_t = ucol[:, :t]
+
+            # indices (unclamped; the padding supplies the edge rows)
+            vcol_t[0] = v[i:i_end]
+            ucol_t[0] = u[j:j_end]
+            numpy.add(vcol_t[0], 1, out=vcol_t[1])
+            numpy.add(ucol_t[0], 1, out=ucol_t[1])
+
+            # packing to the panel whose shape is (B, C, 2, 2, l, t)
+            panel = x[:, :, vcol_t[:, None, :, None],
+                      ucol_t[None, :, None, :]]
+
+            # interpolation
+            # An explicit 4-tap weighted sum is used here instead of
+            # einsum; the j=4 reduction is too small to amortize einsum's
+            # dispatch overhead and the explicit form stays on the
+            # vectorized ufunc path.
+            panel = panel.reshape((B * C, 4, l, t))
+            out = y[:, i:i_end, j:j_end]
+            buf = tmp[:, :l, :t]
+            numpy.multiply(panel[:, 0], wplanes[0][i:i_end, j:j_end],
+                           out=out)
+            for k in range(1, 4):
+                numpy.multiply(panel[:, k], wplanes[k][i:i_end, j:j_end],
+                               out=buf)
+                out += buf
+            del panel
 
     return y.reshape((B, C, out_H, out_W))
 
 
+_TILE_H = 16
+_TILE_W = 16
+
+_interp_bilinear_tiled_code = '''
+#define TH %d
+#define TW %d
+extern "C" __global__
+void resize_images_interpolate_bilinear_tiled(
+        const float* x, const long long* v, const long long* u,
+        const float* vw, const float* uw, float* y,
+        int BC, int H, int W, int out_H, int out_W) {
+    __shared__ float smem[(TH + 1) * (TW + 1)];
+    int ti = blockIdx.y * TH;
+    int tj = blockIdx.x * TW;
+    int r0 = (int)v[ti];
+    int c0 = (int)u[tj];
+
+    // The tile geometry does not depend on the image, so it is computed
+    // once and only the staged window changes per image.
+    int oi = ti + threadIdx.y;
+    int oj = tj + threadIdx.x;
+    int active = oi < out_H && oj < out_W;
+    int dr0 = 0, dr1 = 0, dc0 = 0, dc1 = 0;
+    float wv = 0, wu = 0;
+    if (active) {
+        dr0 = (int)v[oi] - r0;
+        dr1 = min((int)v[oi] + 1, H - 1) - r0;
+        dc0 = (int)u[oj] - c0;
+        dc1 = min((int)u[oj] + 1, W - 1) - c0;
+        wv = vw[oi];
+        wu = uw[oj];
+    }
+
+    // One launch covers every image; blockIdx.z strides over them so
+    // BC may exceed the grid dimension limit.
+    for (int bc = blockIdx.z; bc < BC; bc += gridDim.z) {
+        const float* xb = x + (long long)bc * H * W;
+
+        // Cooperatively stage the (TH + 1) x (TW + 1) input window
+        // covered by this output tile. Rows and columns are clamped at
+        // the image border; the duplicated slots are never read back.
+        for (int k = threadIdx.y * blockDim.x + threadIdx.x;
+             k < (TH + 1) * (TW + 1); k += blockDim.x * blockDim.y) {
+            int dr = k / (TW + 1);
+            int dc = k - dr * (TW + 1);
+            int r = min(r0 + dr, H - 1);
+            int c = min(c0 + dc, W - 1);
+            smem[k] = xb[r * W + c];
+        }
+        __syncthreads();
+
+        if (active) {
+            float p00 = smem[dr0 * (TW + 1) + dc0];
+            float p01 = smem[dr0 * (TW + 1) + dc1];
+            float p10 = smem[dr1 * (TW + 1) + dc0];
+            float p11 = smem[dr1 * (TW + 1) + dc1];
+            y[((long long)bc * out_H + oi) * out_W + oj] =
+                (1 - wv) * ((1 - wu) * p00 + wu * p01)
+                + wv * ((1 - wu) * p10 + wu * p11);
+        }
+        __syncthreads();
+    }
+}
+''' % (_TILE_H, _TILE_W)
+
+
 def interpolate_bilinear_gpu(x, v, u, vw, uw):
     B, C, H, W = x.shape
-    out_H, out_W = v.shape
+    out_H = v.shape[0]
+    out_W = u.shape[0]
     y = cuda.cupy.empty((B, C, out_H, out_W), dtype=x.dtype)
 
+    # The raw kernel is compiled for float32 only; with type checks
+    # disabled (e.g. inside numerical_grad) the input may be float64,
+    # which the templated elementwise fallback below handles.
+    if x.dtype == numpy.float32 and out_H >= H and out_W >= W:
+        # When upscaling, a TH x TW output tile maps to at most a
+        # (TH + 1) x (TW + 1) input window, so the window is staged in
+        # shared memory once per block and the overlapping 2x2 gathers
+        # of neighboring threads are served from there instead of four
+        # independent global loads each.
+        kern = cuda.raw(_interp_bilinear_tiled_code,
+                        'resize_images_interpolate_bilinear_tiled')
+        x = cuda.cupy.ascontiguousarray(x)
+        grid = ((out_W + _TILE_W - 1) // _TILE_W,
+                (out_H + _TILE_H - 1) // _TILE_H,
+                min(B * C, 65535))
+        block = (_TILE_W, _TILE_H, 1)
+        kern(grid, block,
+             (x, v, u, vw, uw, y,
+              numpy.int32(B * C), numpy.int32(H), numpy.int32(W),
+              numpy.int32(out_H), numpy.int32(out_W)))
+        return y
+
+    # When downscaling, the input window of a tile can exceed the shared
+    # memory budget, so keep the per-pixel gather. One replicated row
+    # and column of padding makes the neighbor indices v + 1 and u + 1
+    # unconditionally valid, removing the per-pixel clamp.
+    x = cuda.cupy.pad(x, ((0, 0), (0, 0), (0, 1), (0, 1)), mode='edge')
     cuda.elementwise(
-        'raw T x, S v, S u, T vw, T uw, S H, S W, S outsize', 'T y', '''
-        // indices
-        S v0 = v;
-        S v1 = min(v + 1, (S)(H - 1));
-        S u0 = u;
-        S u1 = min(u + 1, (S)(W - 1));
+        'raw T x, S v, S u, T vw, T uw, S Wp, S psize, S outsize', 'T y', '''
         // weights
         T w0 = (1 - vw) * (1 - uw);
         T w1 = (1 - vw) * uw;
         T w2 = vw * (1 - uw);
         T w3 = vw * uw;
-        // fetch
-        S offset = i / outsize * H * W;
-        T px0 = x[offset + v0 * W + u0];
-        T px1 = x[offset + v0 * W + u1];
-        T px2 = x[offset + v1 * W + u0];
-        T px3 = x[offset + v1 * W + u1];
+        // fetch from the edge-padded input
+        S offset = i / outsize * psize + v * Wp + u;
+        T px0 = x[offset];
+        T px1 = x[offset + 1];
+        T px2 = x[offset + Wp];
+        T px3 = x[offset + Wp + 1];
         // interpolate
         y = (w0 * px0 + w1 * px1) + (w2 * px2 + w3 * px3);
         ''', 'resize_images_interpolate_bilinear'
-    )(x, v, u, vw, uw, H, W, out_H * out_W, y)
+    )(x, v[:, None], u[None, :], vw[:, None], uw[None, :],
+      W + 1, (H + 1) * (W + 1), out_H * out_W, y)
     return y
 
 
+_interp_grad_bilinear_cpu_kernel = None
+
+
+def _get_interp_grad_bilinear_cpu_kernel():
+    # Lazily compiled counterpart of _get_interp_bilinear_cpu_kernel for
+    # the backward scatter. Parallelism comes from the prange over
+    # images: each image accumulates into its own gx row, so the four
+    # corner updates never race across threads.
+    global _interp_grad_bilinear_cpu_kernel
+    if _interp_grad_bilinear_cpu_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _interp_grad_bilinear_cpu_kernel = False
+        else:
+            @numba.njit(parallel=True, fastmath=True)
+            def kernel(gy, v0, v1, u0, u1, vw, uw, gx):
+                BC = gy.shape[0]
+                out_H = v0.shape[0]
+                out_W = u0.shape[0]
+                for bc in numba.prange(BC):
+                    for i in range(out_H):
+                        r0 = v0[i]
+                        r1 = v1[i]
+                        vw1 = vw[i]
+                        vw0 = 1 - vw1
+                        for j in range(out_W):
+                            g = gy[bc, i * out_W + j]
+                            uw1 = uw[j]
+                            uw0 = 1 - uw1
+                            gx[bc, r0 + u0[j]] += vw0 * uw0 * g
+                            gx[bc, r0 + u1[j]] += vw0 * uw1 * g
+                            gx[bc, r1 + u0[j]] += vw1 * uw0 * g
+                            gx[bc, r1 + u1[j]] += vw1 * uw1 * g
+
+            _interp_grad_bilinear_cpu_kernel = kernel
+    return _interp_grad_bilinear_cpu_kernel
+
+
 def interpolate_grad_bilinear_cpu(gy, v, u, vw, uw, H, W):
     B, C, out_H, out_W = gy.shape
 
+    kernel = _get_interp_grad_bilinear_cpu_kernel()
+    if kernel:
+        # The scatter runs entirely in the gradient dtype; no float64
+        # accumulator is materialized and only pixels that actually
+        # receive contributions are touched after the zero fill.
+        v0 = v * W
+        v1 = numpy.minimum(v + 1, H - 1) * W
+        u1 = numpy.minimum(u + 1, W - 1)
+        gx = numpy.zeros((B * C, H * W), dtype=gy.dtype)
+        kernel(gy.reshape((B * C, out_H * out_W)), v0, v1, u, u1, vw, uw, gx)
+        return gx.reshape((B, C, H, W))
+
     # indices
-    vcol = numpy.empty((2, out_H, out_W), dtype=v.dtype)
-    ucol = numpy.empty((2, out_H, out_W), dtype=u.dtype)
+    vcol = numpy.empty((2, out_H), dtype=v.dtype)
+    ucol = numpy.empty((2, out_W), dtype=u.dtype)
     vcol[0] = v
     ucol[0] = u
     numpy.add(vcol[0], 1, out=vcol[1])
@@ -122,29 +347,108 @@ def interpolate_grad_bilinear_cpu(gy, v, u, vw, uw, H, W):
     numpy.minimum(vcol[1], H - 1, out=vcol[1])
     numpy.minimum(ucol[1], W - 1, out=ucol[1])
 
-    # weights
-    wcol = numpy.empty((2, 2, out_H, out_W), dtype=gy.dtype)
-    wcol[0, 1] = uw
-    numpy.subtract(1, wcol[0, 1], out=wcol[0, 0])
-    numpy.multiply(wcol[0], vw, out=wcol[1])
-    wcol[0] -= wcol[1]
+    # weights, as four separate contiguous planes (see the forward path)
+    one_vw = 1 - vw
+    one_uw = 1 - uw
+    wplanes = ((0, 0, one_vw[:, None] * one_uw[None, :]),
+               (0, 1, one_vw[:, None] * uw[None, :]),
+               (1, 0, vw[:, None] * one_uw[None, :]),
+               (1, 1, vw[:, None] * uw[None, :]))
 
     # grad
-    gycol = gy.reshape((B * C, 1, 1, out_H, out_W)) * wcol
-
-    # ravel everything and use `bincount`
-    indices = (vcol[:, None] * W + ucol[None, :]).ravel()
-    offsets = numpy.arange(0, B * C * H * W, H * W, dtype=v.dtype)
-    indices = (offsets[:, None] + indices).ravel()
-    gx = numpy.bincount(indices, weights=gycol.ravel(),
-                        minlength=(B * C * H * W))
+    # Scatter each of the four corners separately with `bincount`.
+    # This fuses the weight multiplication into the per-corner pass and
+    # avoids materializing the full (B * C, 2, 2, out_H, out_W) weighted
+    # tensor. The flat corner indices are shared by all images in the
+    # batch, so they are computed once per corner instead of being
+    # replicated B * C times with per-image offsets.
+    gy = gy.reshape((B * C, out_H * out_W))
+    gx = numpy.zeros((B * C, H * W), dtype=numpy.float64)
+    tmp = numpy.empty((out_H * out_W,), dtype=gy.dtype)
+    for iv, iu, w in wplanes:
+        indices = (vcol[iv][:, None] * W + ucol[iu][None, :]).ravel()
+        weights = w.ravel()
+        # The index tables are monotonic, so the last flat index is the
+        # largest one; adding into the prefix skips bincount's
+        # zero-padding of the untouched tail up to H * W.
+        length = int(indices[-1]) + 1
+        for bc in range(B * C):
+            numpy.multiply(gy[bc], weights, out=tmp)
+            gx[bc, :length] += numpy.bincount(indices, weights=tmp)
     gx = gx.astype(gy.dtype, copy=False)
 
     return gx.reshape((B, C, H, W))
 
 
+_interp_grad_bilinear_gather_code = '''
+extern "C" __global__
+void resize_images_interpolate_grad_bilinear_gather(
+        const float* gy, const long long* v, const long long* u,
+        const float* vw, const float* uw,
+        const long long* ri0, const long long* ri1,
+        const long long* cj0, const long long* cj1,
+        float* gx, int BC, int H, int W, int out_H, int out_W) {
+    int q = blockIdx.x * blockDim.x + threadIdx.x;
+    int p = blockIdx.y * blockDim.y + threadIdx.y;
+    if (p >= H || q >= W) return;
+    // One launch covers every image; blockIdx.z strides over them so
+    // BC may exceed the grid dimension limit.
+    for (int bc = blockIdx.z; bc < BC; bc += gridDim.z) {
+        const float* g = gy + (long long)bc * out_H * out_W;
+        float acc = 0;
+        for (long long i = ri0[p]; i < ri1[p]; ++i) {
+            int vi = (int)v[i];
+            float wv = 0;
+            if (vi == p) wv += 1 - vw[i];
+            if (min(vi + 1, H - 1) == p) wv += vw[i];
+            for (long long j = cj0[q]; j < cj1[q]; ++j) {
+                int uj = (int)u[j];
+                float wu = 0;
+                if (uj == q) wu += 1 - uw[j];
+                if (min(uj + 1, W - 1) == q) wu += uw[j];
+                acc += wv * wu * g[i * out_W + j];
+            }
+        }
+        gx[((long long)bc * H + p) * W + q] = acc;
+    }
+}
+'''
+
+
 def interpolate_grad_bilinear_gpu(gy, v, u, vw, uw, H, W):
     B, C, out_H, out_W = gy.shape
+
+    # The raw kernel is compiled for float32 only; with type checks
+    # disabled (e.g. inside numerical_grad) the gradient may be float64,
+    # which the templated elementwise fallback below handles.
+    if gy.dtype == numpy.float32 and out_H * out_W >= H * W:
+        # When upscaling, many output pixels scatter into the same input
+        # pixel and the atomicAdd version serializes on it. Invert the
+        # loop: one thread per input pixel gathers the bounded range of
+        # output rows/columns that touch it, found by binary search on
+        # the monotonic index tables, with no atomics at all.
+        ph = cuda.cupy.arange(H, dtype=v.dtype)
+        ri0 = cuda.cupy.searchsorted(v, ph - 1, side='left')
+        ri1 = cuda.cupy.searchsorted(v, ph, side='right')
+        pw = cuda.cupy.arange(W, dtype=u.dtype)
+        cj0 = cuda.cupy.searchsorted(u, pw - 1, side='left')
+        cj1 = cuda.cupy.searchsorted(u, pw, side='right')
+
+        gx = cuda.cupy.empty((B * C, H, W), dtype=gy.dtype)
+        kern = cuda.raw(
+            _interp_grad_bilinear_gather_code,
+            'resize_images_interpolate_grad_bilinear_gather')
+        gy = cuda.cupy.ascontiguousarray(gy)
+        grid = ((W + 15) // 16, (H + 15) // 16, min(B * C, 65535))
+        block = (16, 16, 1)
+        kern(grid, block,
+             (gy, v, u, vw, uw, ri0, ri1, cj0, cj1, gx,
+              numpy.int32(B * C), numpy.int32(H), numpy.int32(W),
+              numpy.int32(out_H), numpy.int32(out_W)))
+        return gx.reshape((B, C, H, W))
+
+    # When downscaling, scattered writes rarely collide and the gather
+    # ranges grow with the scale factor, so keep the atomicAdd version.
     gx = cuda.cupy.zeros((B * C, H, W), dtype=gy.dtype)
 
     cuda.elementwise(
@@ -166,7 +470,38 @@ def interpolate_grad_bilinear_gpu(gy, v, u, vw, uw, H, W):
         atomicAdd(&gx[offset + v1 * W + u0], w2 * gy);
         atomicAdd(&gx[offset + v1 * W + u1], w3 * gy);
         ''', 'resize_images_interpolate_grad_bilinear'
-    )(gy, v, u, vw, uw, H, W, out_H * out_W, gx)
+    )(gy, v[:, None], u[None, :], vw[:, None], uw[None, :],
+      H, W, out_H * out_W, gx)
+
+    return gx.reshape((B, C, H, W))
+
+
+def interpolate_grad_nearest_cpu(gy, v, u, H, W):
+    B, C, out_H, out_W = gy.shape
+
+    indices = (v[:, None] * W + u[None, :]).ravel()
+    gy = gy.reshape((B * C, out_H * out_W))
+    gx = numpy.zeros((B * C, H * W), dtype=gy.dtype)
+    # The index tables are monotonic, so the last flat index is the
+    # largest one; assigning into the prefix skips bincount's
+    # zero-padding of the untouched tail up to H * W.
+    length = int(indices[-1]) + 1
+    for bc in range(B * C):
+        gx[bc, :length] = numpy.bincount(indices, weights=gy[bc])
+
+    return gx.reshape((B, C, H, W))
+
+
+def interpolate_grad_nearest_gpu(gy, v, u, H, W):
+    B, C, out_H, out_W = gy.shape
+    gx = cuda.cupy.zeros((B * C, H, W), dtype=gy.dtype)
+
+    cuda.elementwise(
+        'T gy, S v, S u, S H, S W, S outsize', 'raw T gx', '''
+        S offset = i / outsize * H * W;
+        atomicAdd(&gx[offset + v * W + u], gy);
+        ''', 'resize_images_interpolate_grad_nearest'
+    )(gy, v[:, None], u[None, :], H, W, out_H * out_W, gx)
 
     return gx.reshape((B, C, H, W))
 
@@ -174,16 +509,26 @@ def interpolate_grad_bilinear_gpu(gy, v, u, vw, uw, H, W):
 def compute_indices_and_weights(out_size, in_size, mode, align_corners, xp):
     out_H, out_W = out_size
     H, W = in_size
+    # The index computation stays in float64: rounding the scale to
+    # float32 can flip the integer part of exactly representable
+    # products (e.g. 11 * 26 / 22) and select a neighboring pixel,
+    # which changes nearest-mode outputs. Only the fractional weights
+    # are emitted as float32, where an off-by-one integer part is
+    # compensated by the weight approaching one.
     if mode == 'bilinear':
         if align_corners:
-            v = xp.linspace(0, H - 1, num=out_H, dtype=numpy.float)
-            u = xp.linspace(0, W - 1, num=out_W, dtype=numpy.float)
+            # The division happens once per call on scalars; the tables
+            # are then built with a single vectorized multiply.
+            y_scale = (H - 1) / (out_H - 1) if out_H > 1 else 0.
+            x_scale = (W - 1) / (out_W - 1) if out_W > 1 else 0.
+            v = xp.arange(out_H, dtype=numpy.float64) * y_scale
+            u = xp.arange(out_W, dtype=numpy.float64) * x_scale
         else:
             y_scale = H / out_H
             x_scale = W / out_W
-            v = (xp.arange(out_H, dtype=numpy.float) + 0.5) * y_scale - 0.5
+            v = (xp.arange(out_H, dtype=numpy.float64) + 0.5) * y_scale - 0.5
             v = xp.maximum(v, 0)
-            u = (xp.arange(out_W, dtype=numpy.float) + 0.5) * x_scale - 0.5
+            u = (xp.arange(out_W, dtype=numpy.float64) + 0.5) * x_scale - 0.5
             u = xp.maximum(u, 0)
         vw, v = xp.modf(v)
         uw, u = xp.modf(u)
@@ -191,14 +536,104 @@ def compute_indices_and_weights(out_size, in_size, mode, align_corners, xp):
         y_scale = H / out_H
         x_scale = W / out_W
         v = xp.minimum(xp.floor(
-            xp.arange(out_H, dtype=numpy.float) * y_scale), H - 1)
+            xp.arange(out_H, dtype=numpy.float64) * y_scale), H - 1)
         u = xp.minimum(xp.floor(
-            xp.arange(out_W, dtype=numpy.float) * x_scale), W - 1)
+            xp.arange(out_W, dtype=numpy.float64) * x_scale), W - 1)
         vw = xp.zeros_like(v)
         uw = xp.zeros_like(u)
+    v = v.astype(numpy.intp)
+    u = u.astype(numpy.intp)
+    vw = vw.astype(numpy.float32)
+    uw = uw.astype(numpy.float32)
+    return v, u, vw, uw
+
+
+@functools.lru_cache(maxsize=32)
+def _get_index_tables(out_size, in_size, mode, align_corners, xp, dtype,
+                      device_id):
+    # The tables only depend on the shapes and the sampling rule, so for
+    # the common case of repeated same-shape inputs they are computed
+    # once and reused. ``device_id`` is part of the cache key only;
+    # arrays are created on the current device. The returned arrays are
+    # shared between calls and must not be written to.
+    v, u, vw, uw = compute_indices_and_weights(
+        out_size, in_size, mode, align_corners, xp)
+    vw = vw.astype(dtype, copy=False)
+    uw = uw.astype(dtype, copy=False)
     return v, u, vw, uw
 
 
+def _lookup_index_tables(out_size, in_size, mode, align_corners, xp, dtype):
+    device_id = -1 if xp is numpy else cuda.Device().id
+    return _get_index_tables(
+        out_size, in_size, mode, align_corners, xp, dtype, device_id)
+
+
+_scipy_sparse = None
+
+
+def _get_scipy_sparse():
+    global _scipy_sparse
+    if _scipy_sparse is None:
+        try:
+            from scipy import sparse
+            _scipy_sparse = sparse
+        except ImportError:
+            _scipy_sparse = False
+    return _scipy_sparse
+
+
+# Upper bound on the nonzeros of a cached resampling matrix. Unlike the
+# index tables, whose entries are O(out_H + out_W), each matrix holds
+# 4 * out_H * out_W weights plus indices, so the cache is kept small and
+# outputs past the budget (~12 MB per matrix) skip the sparse path.
+_max_resample_matrix_nnz = 2 ** 20
+
+
+@functools.lru_cache(maxsize=4)
+def _build_resample_matrix(out_size, in_size, mode, align_corners, dtype):
+    # One (out_H * out_W, H * W) CSR matrix holding the four corner
+    # weights of every output pixel. The whole forward is then a single
+    # threaded sparse-dense matmul and the backward its transpose.
+    # Duplicate entries at the clamped image border are summed by the
+    # CSR conversion, matching the clamped gather.
+    sparse = _get_scipy_sparse()
+    out_H, out_W = out_size
+    H, W = in_size
+    v, u, vw, uw = _lookup_index_tables(
+        out_size, in_size, mode, align_corners, numpy, dtype)
+    v0 = v * W
+    v1 = numpy.minimum(v + 1, H - 1) * W
+    u1 = numpy.minimum(u + 1, W - 1)
+    one_vw = 1 - vw
+    one_uw = 1 - uw
+    cols = numpy.concatenate([
+        (v0[:, None] + u[None, :]).ravel(),
+        (v0[:, None] + u1[None, :]).ravel(),
+        (v1[:, None] + u[None, :]).ravel(),
+        (v1[:, None] + u1[None, :]).ravel()])
+    weights = numpy.concatenate([
+        (one_vw[:, None] * one_uw[None, :]).ravel(),
+        (one_vw[:, None] * uw[None, :]).ravel(),
+        (vw[:, None] * one_uw[None, :]).ravel(),
+        (vw[:, None] * uw[None, :]).ravel()])
+    rows = numpy.tile(numpy.arange(out_H * out_W), 4)
+    return sparse.csr_matrix(
+        (weights, (rows, cols)), shape=(out_H * out_W, H * W))
+
+
+def _get_resample_matrix(out_size, in_size, mode, align_corners, dtype):
+    # Returns the cached CSR resampling matrix, or None when scipy is
+    # not available, when the fused numba kernels take precedence, or
+    # when the matrix would blow the cache memory budget.
+    if _get_interp_bilinear_cpu_kernel() or not _get_scipy_sparse():
+        return None
+    if 4 * out_size[0] * out_size[1] > _max_resample_matrix_nnz:
+        return None
+    return _build_resample_matrix(
+        out_size, in_size, mode, align_corners, dtype)
+
+
 class ResizeImages(function_node.FunctionNode):
 
     def __init__(self, output_shape, mode, align_corners):
@@ -221,22 +656,30 @@ class ResizeImages(function_node.FunctionNode):
         x, = inputs
         xp = backend.get_array_module(x)
 
-        v, u, vw, uw = compute_indices_and_weights(
+        v, u, vw, uw = _lookup_index_tables(
             (self.out_H, self.out_W), x.shape[2:],
-            self.mode, self.align_corners, xp)
-        v = v.astype(numpy.intp)
-        u = u.astype(numpy.intp)
-        vw = vw.astype(x.dtype)
-        uw = uw.astype(x.dtype)
-
-        # Meshgrid-like operation. Meshgrid can cause
-        # performance loss due to memory consumption.
-        # Note that numpy 1.9 doesn't support broadcast_to method.
-        v, u, vw, uw = xp.broadcast_arrays(
-            v[:, None], u[None, :], vw[:, None], uw[None, :])
+            self.mode, self.align_corners, xp, x.dtype)
+        # Keep the tables for the backward pass, which uses the very
+        # same ones.
+        self._index_tables = v, u, vw, uw
+
+        if self.mode == 'nearest':
+            # The weights are all zero in nearest mode, so the 4-tap
+            # interpolation degenerates to its first term; the output is
+            # a pure gather of the selected pixels.
+            y = x[:, :, v[:, None], u[None, :]]
+            return y,
 
         if xp is numpy:
-            y = interpolate_bilinear_cpu(x, v, u, vw, uw)
+            S = _get_resample_matrix(
+                (self.out_H, self.out_W), x.shape[2:],
+                self.mode, self.align_corners, x.dtype)
+            if S is not None:
+                B, C, H, W = x.shape
+                y = S.dot(x.reshape((B * C, H * W)).T).T
+                y = y.reshape((B, C, self.out_H, self.out_W))
+            else:
+                y = interpolate_bilinear_cpu(x, v, u, vw, uw)
         else:
             y = interpolate_bilinear_gpu(x, v, u, vw, uw)
         return y,
@@ -245,18 +688,21 @@ class ResizeImages(function_node.FunctionNode):
         return ResizeImagesGrad(
             self.inputs[0].shape,
             (self.out_H, self.out_W),
-            self.mode, self.align_corners).apply(grad_outputs)
+            self.mode, self.align_corners,
+            index_tables=self._index_tables).apply(grad_outputs)
 
 
 class ResizeImagesGrad(function_node.FunctionNode):
 
-    def __init__(self, input_shape, output_shape, mode, align_corners):
+    def __init__(self, input_shape, output_shape, mode, align_corners,
+                 index_tables=None):
         self.out_H = output_shape[0]
         self.out_W = output_shape[1]
         self.input_shape = input_shape
         assert mode in ['bilinear', 'nearest']
         self.mode = mode
         self.align_corners = align_corners
+        self._index_tables = index_tables
 
     def check_type_forward(self, in_types):
         type_check._argname(in_types, ('gy',))
@@ -273,22 +719,32 @@ class ResizeImagesGrad(function_node.FunctionNode):
 
         _, C, H, W = self.input_shape
 
-        v, u, vw, uw = compute_indices_and_weights(
-            (self.out_H, self.out_W), (H, W),
-            self.mode, self.align_corners, xp)
-        v = v.astype(numpy.intp)
-        u = u.astype(numpy.intp)
-        vw = vw.astype(gy.dtype)
-        uw = uw.astype(gy.dtype)
-
-        # Meshgrid-like operation. Meshgrid can cause
-        # performance loss due to memory consumption.
-        # Note that numpy 1.9 doesn't support broadcast_to method.
-        v, u, vw, uw = xp.broadcast_arrays(
-            v[:, None], u[None, :], vw[:, None], uw[None, :])
+        tables = self._index_tables
+        if tables is None or backend.get_array_module(*tables) is not xp:
+            tables = _lookup_index_tables(
+                (self.out_H, self.out_W), (H, W),
+                self.mode, self.align_corners, xp, gy.dtype)
+        v, u, vw, uw = tables
+
+        if self.mode == 'nearest':
+            # Single-corner scatter; see the corresponding gather in
+            # ResizeImages.forward.
+            if xp is numpy:
+                gx = interpolate_grad_nearest_cpu(gy, v, u, H, W)
+            else:
+                gx = interpolate_grad_nearest_gpu(gy, v, u, H, W)
+            return gx,
 
         if xp is numpy:
-            gx = interpolate_grad_bilinear_cpu(gy, v, u, vw, uw, H, W)
+            S = _get_resample_matrix(
+                (self.out_H, self.out_W), (H, W),
+                self.mode, self.align_corners, gy.dtype)
+            if S is not None:
+                B = gy.shape[0]
+                gy2 = gy.reshape((B * C, self.out_H * self.out_W))
+                gx = S.T.dot(gy2.T).T.reshape((B, C, H, W))
+            else:
+                gx = interpolate_grad_bilinear_cpu(gy, v, u, vw, uw, H, W)
         else:
             gx = interpolate_grad_bilinear_gpu(gy, v, u, vw, uw, H, W)
         return gx,
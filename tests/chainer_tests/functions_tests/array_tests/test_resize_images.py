@@ -2,8 +2,10 @@ import unittest
 
 import numpy
 
+import chainer
 from chainer.backends import cuda
 from chainer import functions
+from chainer.functions.array import resize_images
 from chainer import gradient_check
 from chainer import testing
 from chainer.testing import attr
@@ -232,4 +234,60 @@ class TestResizeImagesBackward(unittest.TestCase):
                                    cuda.to_gpu(self.gy), cuda.to_gpu(self.ggx))
 
 
+@testing.parameterize(*testing.product({
+    'output_shape': [(10, 9), (3, 4)],
+    'align_corners': [True, False],
+}))
+class TestResizeImagesCpuBackendAgreement(unittest.TestCase):
+    # The CPU bilinear path has optional numba and scipy.sparse
+    # backends selected at runtime. Force each one by stubbing the
+    # module-level caches and check that it agrees with the plain
+    # numpy implementation on both forward and backward.
+
+    in_shape = (2, 3, 8, 6)
+
+    def setUp(self):
+        self.x = numpy.random.uniform(
+            size=self.in_shape).astype(numpy.float32)
+        gy_shape = self.in_shape[:2] + self.output_shape
+        self.gy = numpy.random.uniform(
+            size=gy_shape).astype(numpy.float32)
+
+    def _forward_backward(self):
+        x = chainer.Variable(self.x)
+        y = functions.resize_images(
+            x, self.output_shape, align_corners=self.align_corners)
+        y.grad = self.gy
+        y.backward()
+        return y.array, x.grad
+
+    def _run_with(self, **overrides):
+        saved = {name: getattr(resize_images, name) for name in overrides}
+        for name, value in overrides.items():
+            setattr(resize_images, name, value)
+        try:
+            return self._forward_backward()
+        finally:
+            for name, value in saved.items():
+                setattr(resize_images, name, value)
+
+    def test_cpu_backends_agree(self):
+        y_expect, gx_expect = self._run_with(
+            _interp_bilinear_cpu_kernel=False,
+            _interp_grad_bilinear_cpu_kernel=False,
+            _scipy_sparse=False)
+
+        if resize_images._get_scipy_sparse():
+            y, gx = self._run_with(
+                _interp_bilinear_cpu_kernel=False,
+                _interp_grad_bilinear_cpu_kernel=False)
+            testing.assert_allclose(y, y_expect)
+            testing.assert_allclose(gx, gx_expect)
+
+        if resize_images._get_interp_bilinear_cpu_kernel():
+            y, gx = self._run_with(_scipy_sparse=False)
+            testing.assert_allclose(y, y_expect)
+            testing.assert_allclose(gx, gx_expect)
+
+
 testing.run_module(__name__, __file__)